@@ -211,6 +211,12 @@ func LeaseFromProtobuf(
 }
 
 func (l *Lease) ToProtobuf() *cpb.Lease {
+	return l.toProtobuf(time.Now())
+}
+
+// toProtobuf converts the lease using now as the end of the effective
+// duration of leases that are still active.
+func (l *Lease) toProtobuf(now time.Time) *cpb.Lease {
 	var conditions []*pb.Condition
 	for _, condition := range l.Status.Conditions {
 		conditions = append(conditions, &pb.Condition{
@@ -247,7 +253,7 @@ func (l *Lease) ToProtobuf() *cpb.Lease {
 	// Actual times from Status
 	if l.Status.BeginTime != nil {
 		lease.EffectiveBeginTime = timestamppb.New(l.Status.BeginTime.Time)
-		endTime := time.Now()
+		endTime := now
 		if l.Status.EndTime != nil {
 			endTime = l.Status.EndTime.Time
 			lease.EffectiveEndTime = timestamppb.New(endTime)
@@ -267,9 +273,11 @@ func (l *Lease) ToProtobuf() *cpb.Lease {
 }
 
 func (l *LeaseList) ToProtobuf() *cpb.ListLeasesResponse {
+	// Sample the clock once so all active leases in the page share the same reference time
+	now := time.Now()
 	var jleases []*cpb.Lease
 	for _, jlease := range l.Items {
-		jleases = append(jleases, jlease.ToProtobuf())
+		jleases = append(jleases, jlease.toProtobuf(now))
 	}
 	return &cpb.ListLeasesResponse{
 		Leases:        jleases,
@@ -18,6 +18,7 @@ package v1alpha1
 
 import (
 	"testing"
+	"time"
 
 	. "github.com/onsi/ginkgo/v2"
 	. "github.com/onsi/gomega"
@@ -275,3 +276,27 @@ var _ = Describe("ParseLabelSelector", func() {
 		})
 	})
 })
+
+var _ = Describe("LeaseList.ToProtobuf", func() {
+	It("should compute the effective duration of active leases against the same reference time", func() {
+		beginTime := metav1.NewTime(time.Now().Add(-time.Minute))
+		list := LeaseList{
+			Items: []Lease{
+				{
+					ObjectMeta: metav1.ObjectMeta{Namespace: "default", Name: "lease-a"},
+					Status:     LeaseStatus{BeginTime: &beginTime},
+				},
+				{
+					ObjectMeta: metav1.ObjectMeta{Namespace: "default", Name: "lease-b"},
+					Status:     LeaseStatus{BeginTime: &beginTime},
+				},
+			},
+		}
+
+		response := list.ToProtobuf()
+		Expect(response.Leases).To(HaveLen(2))
+		Expect(response.Leases[0].EffectiveDuration.AsDuration()).To(BeNumerically(">=", time.Minute))
+		Expect(response.Leases[0].EffectiveDuration.AsDuration()).
+			To(Equal(response.Leases[1].EffectiveDuration.AsDuration()))
+	})
+})
@@ -58,5 +58,10 @@ func BearerTokenFromContext(ctx context.Context) (string, error) {
 	// Invariant: len(authorization) >= 7
 	token := authorization[7:]
 
+	// Reject empty or whitespace-only tokens here instead of running them through the authenticators
+	if strings.TrimSpace(token) == "" {
+		return "", status.Errorf(codes.InvalidArgument, "malformed authorization header")
+	}
+
 	return token, nil
 }
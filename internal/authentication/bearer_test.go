@@ -0,0 +1,54 @@
+package authentication
+
+import (
+	"context"
+	"testing"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"google.golang.org/grpc/codes"
+	"google.golang.org/grpc/metadata"
+	"google.golang.org/grpc/status"
+)
+
+func TestAuthentication(t *testing.T) {
+	RegisterFailHandler(Fail)
+	RunSpecs(t, "Authentication Suite")
+}
+
+var _ = Describe("BearerTokenFromContext", func() {
+	DescribeTable("should extract the bearer token from the authorization header",
+		func(md metadata.MD, expectedToken string, expectedCode codes.Code) {
+			ctx := context.Background()
+			if md != nil {
+				ctx = metadata.NewIncomingContext(ctx, md)
+			}
+
+			token, err := BearerTokenFromContext(ctx)
+			if expectedCode == codes.OK {
+				Expect(err).NotTo(HaveOccurred())
+				Expect(token).To(Equal(expectedToken))
+			} else {
+				Expect(err).To(HaveOccurred())
+				Expect(status.Code(err)).To(Equal(expectedCode))
+				Expect(token).To(BeEmpty())
+			}
+		},
+		Entry("valid token",
+			metadata.Pairs("authorization", "Bearer token"), "token", codes.OK),
+		Entry("valid token with lowercase scheme",
+			metadata.Pairs("authorization", "bearer token"), "token", codes.OK),
+		Entry("missing metadata",
+			nil, "", codes.InvalidArgument),
+		Entry("missing authorization header",
+			metadata.Pairs("other", "value"), "", codes.Unauthenticated),
+		Entry("multiple authorization headers",
+			metadata.Pairs("authorization", "Bearer a", "authorization", "Bearer b"), "", codes.InvalidArgument),
+		Entry("malformed authorization header",
+			metadata.Pairs("authorization", "Basic dXNlcjpwYXNz"), "", codes.InvalidArgument),
+		Entry("empty bearer token",
+			metadata.Pairs("authorization", "Bearer "), "", codes.InvalidArgument),
+		Entry("whitespace-only bearer token",
+			metadata.Pairs("authorization", "Bearer   "), "", codes.InvalidArgument),
+	)
+})
@@ -152,15 +152,7 @@ func (s *ClientService) ListLeases(ctx context.Context, req *cpb.ListLeasesReque
 		return nil, err
 	}
 
-	var results []*cpb.Lease
-	for _, lease := range jleases.Items {
-		results = append(results, lease.ToProtobuf())
-	}
-
-	return &cpb.ListLeasesResponse{
-		Leases:        results,
-		NextPageToken: jleases.Continue,
-	}, nil
+	return jleases.ToProtobuf(), nil
 }
 
 func (s *ClientService) CreateLease(ctx context.Context, req *cpb.CreateLeaseRequest) (*cpb.Lease, error) {